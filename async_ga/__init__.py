@@ -9,6 +9,7 @@ Motivation:
 
 ### Usage
 For usage, see `help(async_ga.AsyncGA)`.
+To resolve the type-hints shown by `help`, call `async_ga.finalize_type_hints()` first.
 
 ### Example
 For the example documentation, see `help(async_ga.DefaultGA)`.
@@ -28,6 +29,7 @@ For the example documentation, see `help(async_ga.DefaultGA)`.
 from async_ga.chromosome import *
 from async_ga.crosser import *
 from async_ga.filter import *
+from async_ga.fitness.cache import *
 from async_ga.fitness.function import *
 from async_ga.fitness.maturity import *
 from async_ga.ga import *
@@ -35,22 +37,25 @@ from async_ga.mutator import *
 from async_ga.selector import *
 from async_ga.terminator import *
 
-from types import FunctionType
-from typing import get_type_hints
 
-# Finalize type-hints.
-for obj in list(vars().values()):
-    if obj is FunctionType or obj is get_type_hints:
-        continue
-    elif isinstance(obj, FunctionType):
-        obj.__annotations__ = get_type_hints(obj)
-    elif not isinstance(obj, type):
-        continue
-    obj.__annotations__ = get_type_hints(obj)
-    for name, method in vars(obj).items():
-        if isinstance(method, classmethod):
-            method.__func__.__annotations__ = get_type_hints(method.__func__)
-        elif isinstance(method, FunctionType):
-            method.__annotations__ = get_type_hints(method)
+def finalize_type_hints() -> None:
+    """
+    Replace the string annotations of every exported class and function
+    with their resolved type-hints, such as for use with `help(...)`.
 
-del FunctionType, get_type_hints, method, name, obj
+    Not done on import, since resolving every type-hint slows down `import async_ga`.
+    """
+    from types import FunctionType
+    from typing import get_type_hints
+    for obj in list(globals().values()):
+        if isinstance(obj, FunctionType):
+            obj.__annotations__ = get_type_hints(obj)
+            continue
+        elif not isinstance(obj, type):
+            continue
+        obj.__annotations__ = get_type_hints(obj)
+        for method in vars(obj).values():
+            if isinstance(method, classmethod):
+                method.__func__.__annotations__ = get_type_hints(method.__func__)
+            elif isinstance(method, FunctionType):
+                method.__annotations__ = get_type_hints(method)
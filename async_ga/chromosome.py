@@ -1,5 +1,7 @@
 from __future__ import annotations
+from array import array
 from collections import UserList
+from operator import attrgetter
 import sys
 from typing import Any, Generic, Iterable, List, MutableSequence, Optional, TypeVar
 
@@ -13,7 +15,9 @@ if sys.version_info < (3, 9):
 
 
 class Fitness:
-    """Stores the fitness statistics."""
+    """Stores the fitness statistics. Other statistics may also be stored as attributes."""
+    # Slot the statistics updated every estimate, keeping a `__dict__` for any additional statistics.
+    __slots__ = ("__dict__", "mean", "variance")
     mean: float
     variance: float
 
@@ -26,16 +30,24 @@ class Chromosome(UserList[T], Generic[T]):
     Chromosomes behave like normal lists, but they also store their
     age, fitness statistics, and whether or not the chromosome is
     still actively updating its fitness.
+
+    If a `typecode` is given, the genes are stored in a compact
+    `array.array` of that typecode instead of a list. Such chromosomes
+    only support what `array.array` supports, so methods such as `sort`,
+    `clear`, and adding lists fail, and they compare unequal to lists.
     """
     age: int
     fitness: Fitness
     is_active: bool
 
-    def __init__(self: Chromosome[T], data: Iterable[T] = (), /) -> None:
+    def __init__(self: Chromosome[T], data: Iterable[T] = (), /, typecode: Optional[str] = None) -> None:
         self.age = 0
-        self.data = list(data)
+        self.data = list(data) if typecode is None else array(typecode, data)
         self.fitness = Fitness()
         self.is_active = True
 
 
 Population = List[Chromosome[T]]
+
+# Sort key for populations, resolving `chromosome.fitness.mean` in C.
+fitness_mean = attrgetter("fitness.mean")
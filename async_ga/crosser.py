@@ -2,7 +2,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from async_ga.chromosome import Chromosome
 import random
-from typing import AsyncIterable, AsyncIterator, Generic, Iterable, Iterator, TypeVar, Union
+from typing import AsyncIterable, AsyncIterator, Generic, Iterable, Iterator, List, TypeVar, Union
 
 __all__ = ["Crosser", "UniformCrosser", "SinglePointCrosser", "ArithmeticCrosser"]
 
@@ -24,15 +24,25 @@ class UniformCrosser(Crosser[T], Generic[T]):
     """Cross parents by choosing genes from each parent randomly."""
     repeat: int = 1
 
-    async def cross(self: UniformCrosser[T], parent1: Chromosome[T], parent2: Chromosome[T], /) -> AsyncIterator[Iterator[T]]:
-        """Cross two parents, choosing each gene randomly."""
-        for _ in range(self.repeat):
-            yield map(self.random_gene, parent1, parent2)
+    async def cross(self: UniformCrosser[T], parent1: Chromosome[T], parent2: Chromosome[T], /) -> AsyncIterator[Iterable[T]]:
+        """Cross two parents, choosing each gene randomly using `self.random_gene`."""
+        data1 = parent1.data
+        data2 = parent2.data
+        n = len(data1)
+        if type(self).random_gene is not UniformCrosser.random_gene:
+            for _ in range(self.repeat):
+                yield map(self.random_gene, data1, data2)
+        else:
+            for _ in range(self.repeat):
+                # Choose the parent of every gene at once using the bits of a single random number.
+                bits = format(random.getrandbits(n), f"0{n}b")
+                yield [gene1 if bit == "1" else gene2 for bit, gene1, gene2 in zip(bits, data1, data2)]
         async for child in super().cross(parent1, parent2):
             yield child
 
     @staticmethod
     def random_gene(*genes: T) -> T:
+        """Choose one of the genes randomly."""
         return random.choice(genes)
 
 
@@ -40,12 +50,15 @@ class SinglePointCrosser(Crosser[T], Generic[T]):
     """Cross parents by choosing genes from one parent up to a crossover point, and then swapping to the second parent."""
     repeat: int = 1
 
-    async def cross(self: SinglePointCrosser[T], parent1: Chromosome[T], parent2: Chromosome[T], /) -> AsyncIterator[Chromosome[T]]:
+    async def cross(self: SinglePointCrosser[T], parent1: Chromosome[T], parent2: Chromosome[T], /) -> AsyncIterator[List[T]]:
         """Cross two parents and produce 2 varying children from them."""
+        # Slice the underlying data to avoid creating intermediate chromosomes.
+        data1 = parent1.data
+        data2 = parent2.data
         for _ in range(self.repeat):
-            i = random.randrange(1, len(parent1))
-            yield parent1[:i] + parent2[i:]
-            yield parent2[:i] + parent1[i:]
+            i = random.randrange(1, len(data1))
+            yield data1[:i] + data2[i:]
+            yield data2[:i] + data1[i:]
         async for child in super().cross(parent1, parent2):
             yield child
 
@@ -56,7 +69,7 @@ class ArithmeticCrosser(Crosser[Numeric], Generic[Numeric]):
     async def cross(self: SinglePointCrosser[Numeric], parent1: Chromosome[Numeric], parent2: Chromosome[Numeric], /) -> AsyncIterator[Iterator[Numeric]]:
         """Cross two parents and produce 2 varying children from them."""
         # Take the averages of the parents' genes.
-        yield map(self.average, parent1, parent2)
+        yield map(self.average, parent1.data, parent2.data)
         async for child in super().cross(parent1, parent2):
             yield child
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from async_ga.chromosome import Chromosome, Population
+from async_ga.chromosome import Chromosome, Population, fitness_mean
+from bisect import bisect
+from inspect import iscoroutinefunction
+from itertools import accumulate
 import random
-from typing import AsyncIterable, AsyncIterator, Generic, List, TypeVar, Union
+from typing import Any, AsyncIterable, AsyncIterator, Generic, List, TypeVar, Union
 
 __all__ = ["Filter", "EliteFilter", "RandomFilter", "TournamentFilter", "RouletteFilter"]
 
@@ -35,7 +38,12 @@ class RandomFilter(Filter[T], ABC, Generic[T]):
     """Remove a random chromosome based on some weights."""
     population_length: int
 
-    async def filter_key(self: RandomFilter[T], weight: float) -> float:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if iscoroutinefunction(cls.filter_key):
+            raise TypeError(f"{cls.__name__}.filter_key must be synchronous, not async")
+
+    def filter_key(self: RandomFilter[T], weight: float) -> float:
         """A modifiable key function that allows different probabilities that a chromosome is chosen."""
         return weight
 
@@ -44,21 +52,42 @@ class RandomFilter(Filter[T], ABC, Generic[T]):
         """Generate the weights from the population. Low weights -> low probability of being removed."""
 
     async def filter_nonsurvivors(self: RandomFilter[T], population: Population[T]) -> AsyncIterator[Chromosome[T]]:
-        """Remove a random chromosome based on some weights."""
+        """Remove random chromosomes based on some weights until the population is small enough."""
         if len(population) > self.population_length:
             weights = [weight async for weight in self.get_weights(population)]
             min_weight = min(weights)
             for i, weight in enumerate(weights):
-                weights[i] = await self.filter_key(weight - min_weight)
-            yield population.pop(random.choices(range(len(population)), weights)[0])
-        async for chromosome in super().filter_nonsurvivors(population, chromosome):
+                weights[i] = self.filter_key(weight - min_weight)
+            # Draw from the cumulative weights computed once, rejecting repeated nonsurvivors.
+            cum_weights = list(accumulate(weights))
+            total = cum_weights[-1]
+            remaining = sum(weight > 0 for weight in weights)
+            random_ = random.random
+            # Mark the nonsurvivors first and then remove them all at once,
+            # instead of shifting the population with every `population.pop(i)`.
+            dead = set()
+            while len(population) - len(dead) > self.population_length:
+                # If only zero weights remain, such as when the fitnesses tie, remove uniformly from the rest.
+                if remaining == 0:
+                    alive = [i for i in range(len(population)) if i not in dead]
+                    dead.update(random.sample(alive, len(alive) - self.population_length))
+                    break
+                i = bisect(cum_weights, random_() * total)
+                if i not in dead:
+                    dead.add(i)
+                    remaining -= weights[i] > 0
+            nonsurvivors = [population[i] for i in dead]
+            population[:] = [chromosome for i, chromosome in enumerate(population) if i not in dead]
+            for chromosome in nonsurvivors:
+                yield chromosome
+        async for chromosome in super().filter_nonsurvivors(population):
             yield chromosome
 
 
 class TournamentFilter(RandomFilter[T], Generic[T]):
     """Tournament filtering randomly selects chromosomes based on their population ranking."""
 
-    async def filter_key(self: TournamentFilter[T], weight: float) -> float:
+    def filter_key(self: TournamentFilter[T], weight: float) -> float:
         """By default, the tournament filter squares the weights."""
         return weight * weight
 
@@ -73,5 +102,5 @@ class RouletteFilter(RandomFilter[T], Generic[T]):
 
     async def get_weights(self: RouletteFilter[T], population: Population[T]) -> AsyncIterator[float]:
         """Generate the weights from the population using the fitness means."""
-        for chromosome in population:
-            yield chromosome.fitness.mean
+        for mean in map(fitness_mean, population):
+            yield mean
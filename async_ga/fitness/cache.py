@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Hashable, Optional, OrderedDict, Tuple
+
+__all__ = ["FitnessCache"]
+
+
+class FitnessCache:
+    """
+    A least recently used cache of finished fitnesses, keyed by the chromosome's contents.
+
+    Stores the `(mean, variance, age)` of each chromosome's fitness for up to
+    `maxsize` chromosomes, and counts the `hits` and `misses` of `get`.
+    """
+    __slots__ = ("_fitnesses", "hits", "maxsize", "misses")
+    _fitnesses: OrderedDict[Hashable, Tuple[float, float, int]]
+    hits: int
+    maxsize: int
+    misses: int
+
+    def __init__(self: FitnessCache, maxsize: int = 1024, /) -> None:
+        self._fitnesses = OrderedDict()
+        self.hits = 0
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def __contains__(self: FitnessCache, key: Hashable, /) -> bool:
+        return key in self._fitnesses
+
+    def __len__(self: FitnessCache, /) -> int:
+        return len(self._fitnesses)
+
+    def __repr__(self: FitnessCache, /) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize}, hits={self.hits}, misses={self.misses}, size={len(self)})"
+
+    def clear(self: FitnessCache, /) -> None:
+        """Remove every cached fitness and reset the counters."""
+        self._fitnesses.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self: FitnessCache, key: Hashable, /) -> Optional[Tuple[float, float, int]]:
+        """Return the cached `(mean, variance, age)` and mark it as recently used, or None if it is not cached."""
+        fitness = self._fitnesses.get(key)
+        if fitness is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._fitnesses.move_to_end(key)
+        return fitness
+
+    def put(self: FitnessCache, key: Hashable, mean: float, variance: float, age: int, /) -> None:
+        """Cache the fitness, evicting the least recently used fitnesses beyond the `maxsize`."""
+        if self.maxsize <= 0:
+            return
+        fitnesses = self._fitnesses
+        fitnesses[key] = (mean, variance, age)
+        fitnesses.move_to_end(key)
+        while len(fitnesses) > self.maxsize:
+            fitnesses.popitem(last=False)
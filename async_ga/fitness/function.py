@@ -1,9 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from async_ga.chromosome import Chromosome
-from typing import AsyncIterable, Generic, TypeVar
+import asyncio
+from typing import Any, AsyncIterable, Dict, Generic, List, Set, Tuple, TypeVar
 
-__all__ = ["FitnessFunction"]
+__all__ = ["FitnessFunction", "BatchFitnessFunction"]
 
 T = TypeVar("T")
 
@@ -16,3 +17,85 @@ class FitnessFunction(Generic[T]):
         """Generates estimates of the chromosome's fitness."""
         for fitness in ():
             yield fitness
+
+    async def _close_fitness(self: FitnessFunction[T]) -> None:
+        """Stop any background work used by `fitness_of` once the genetic algorithm finishes evolving."""
+        pass
+
+
+class BatchFitnessFunction(FitnessFunction[T], Generic[T]):
+    """
+    Computes fitness estimates for every chromosome waiting on an estimate at once.
+
+    Useful if the estimates share expensive setup, such as loading data,
+    which is then done once per batch instead of once per chromosome.
+    """
+    _batch: List[Tuple[Chromosome[T], asyncio.Future]]
+    _batch_tasks: Set[asyncio.Task]
+
+    def __init__(self: BatchFitnessFunction[T], *args: Any, **kwargs: Any) -> None:
+        self._batch = []
+        self._batch_tasks = set()
+        super().__init__(*args, **kwargs)
+
+    def __getstate__(self: BatchFitnessFunction[T]) -> Dict[str, Any]:
+        """Leave out the pending batch, which belongs to the running event loop."""
+        getstate = getattr(super(), "__getstate__", None)
+        state = dict(vars(self) if getstate is None else getstate())
+        state.pop("_batch", None)
+        state.pop("_batch_tasks", None)
+        return state
+
+    def __setstate__(self: BatchFitnessFunction[T], state: Dict[str, Any]) -> None:
+        vars(self).update(state)
+        self._batch = []
+        self._batch_tasks = set()
+
+    @abstractmethod
+    async def fitness_batch(self: BatchFitnessFunction[T], chromosomes: List[Chromosome[T]]) -> List[float]:
+        """Returns one fitness estimate for each of the chromosomes, in the same order."""
+        raise NotImplementedError("No batch fitness is given.")
+
+    async def _evaluate_batch(self: BatchFitnessFunction[T]) -> None:
+        """Evaluates every chromosome which requested an estimate since the batch was scheduled."""
+        batch = self._batch
+        self._batch = []
+        try:
+            fitnesses = await self.fitness_batch([chromosome for chromosome, _ in batch])
+            if len(fitnesses) != len(batch):
+                raise ValueError(f"expected {len(batch)} fitnesses, got {len(fitnesses)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), fitness in zip(batch, fitnesses):
+                if not future.done():
+                    future.set_result(fitness)
+
+    async def fitness_of(self: BatchFitnessFunction[T], chromosome: Chromosome[T]) -> AsyncIterable[float]:
+        """Generates estimates of the chromosome's fitness by adding it to the next batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # The first chromosome schedules the batch, which runs once the other chromosomes have been added.
+            if not self._batch:
+                task = asyncio.create_task(self._evaluate_batch())
+                # Free up the reference to the batch once it is done.
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+            future = loop.create_future()
+            self._batch.append((chromosome, future))
+            yield await future
+
+    async def _close_fitness(self: BatchFitnessFunction[T]) -> None:
+        """Cancel the pending batches, whose chromosomes are no longer waiting on them."""
+        batch = self._batch
+        self._batch = []
+        for _, future in batch:
+            future.cancel()
+        tasks = list(self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._batch_tasks.clear()
+        await super()._close_fitness()
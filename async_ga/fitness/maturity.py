@@ -2,9 +2,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from async_ga.chromosome import Chromosome
 import asyncio
+from inspect import iscoroutinefunction
 from math import sqrt
-from time import time
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 __all__ = ["Maturity", "AgeMaturity", "DeterministicMaturity", "StatisticsMaturity", "TimeMaturity", "VarianceMaturity"]
 
@@ -13,46 +13,70 @@ T = TypeVar("T")
 
 class Maturity(ABC, Generic[T]):
     """Abstract base class for checking if a chromosome is mature."""
+    _share_fitnesses: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Async overrides would return a coroutine, which is always truthy.
+        if iscoroutinefunction(cls.is_mature):
+            raise TypeError(f"{cls.__name__}.is_mature must be synchronous, not async")
 
     @abstractmethod
-    async def is_mature(self: Maturity[T], chromosome: Chromosome[T]) -> bool:
+    def is_mature(self: Maturity[T], chromosome: Chromosome[T]) -> bool:
         """
         Returns if the chromosome is mature.
 
-        Subclasses should call `await super().is_mature(chromosome)` to ensure
+        Subclasses should call `super().is_mature(chromosome)` to ensure
         other maturity checks are checked.
         """
         return hasattr(chromosome.fitness, "mean") and hasattr(chromosome.fitness, "variance")
 
+    async def wait_for_maturity(self: Maturity[T], chromosome: Chromosome[T]) -> None:
+        """
+        Waits for the chromosome to finish maturing once it is mature.
+
+        Subclasses should call `await super().wait_for_maturity(chromosome)`
+        to ensure other maturity waits are waited for.
+        """
+        pass
+
 
 class AgeMaturity(Maturity[T], Generic[T]):
     """Checks if a chromosome is mature based on its age."""
     age: int = 10
     iteration: int = 0
 
-    async def is_mature(self: AgeMaturity[int], chromosome: Chromosome[T]) -> bool:
+    def is_mature(self: AgeMaturity[int], chromosome: Chromosome[T]) -> bool:
         """Checks if a chromosome is mature based on its age, plus the square root of the current iteration."""
-        return chromosome.age >= self.age + sqrt(self.iteration) and await super().is_mature(chromosome)
+        return chromosome.age >= self.age + sqrt(self.iteration) and super().is_mature(chromosome)
 
 
 class DeterministicMaturity(Maturity[T], Generic[T]):
-    """For deterministic fitnesses, wait until the chromosome is fully matured."""
+    """
+    For deterministic fitnesses, wait until the chromosome is fully matured.
 
-    async def is_mature(self: AgeMaturity[int], chromosome: Chromosome[T]) -> bool:
+    Since identical chromosomes have identical fitnesses, chromosomes wait
+    for an identical chromosome to finish instead of recomputing its fitness,
+    and finished fitnesses are cached.
+    """
+    _share_fitnesses: bool = True
+    fitness_cache_size: int = 1024
+
+    def is_mature(self: AgeMaturity[int], chromosome: Chromosome[T]) -> bool:
         """Wait until the chromosome is fully matured."""
-        return not chromosome.is_active and await super().is_mature(chromosome)
+        return not chromosome.is_active and super().is_mature(chromosome)
 
 
 class StatisticsMaturity(Maturity[T], Generic[T]):
     """Checks if a chromosome is mature based on its test statistic."""
     test_statistic: float = 1.0
 
-    async def is_mature(self: StatisticsMaturity[int], chromosome: Chromosome[T]) -> bool:
+    def is_mature(self: StatisticsMaturity[int], chromosome: Chromosome[T]) -> bool:
         """Checks if a chromosome is mature based on its fitness variance."""
         return (
             chromosome.age > 1
             and sqrt(chromosome.fitness.variance / (chromosome.age - 1)) < self.test_statistic
-            and await super().is_mature(chromosome)
+            and super().is_mature(chromosome)
         )
 
 
@@ -60,19 +84,24 @@ class TimeMaturity(Maturity[T], Generic[T]):
     """Checks if a chromosome is mature based on how much time has elapsed."""
     timeout: float = 0.1
 
-    async def is_mature(self: TimeMaturity[int], chromosome: Chromosome[T]) -> bool:
-        """Checks if a chromosome is mature based on how much time has elapsed."""
-        start = time()
-        if not await super().is_mature(chromosome):
-            return False
-        await asyncio.sleep(start - time() + self.timeout)
-        return True
+    def is_mature(self: TimeMaturity[int], chromosome: Chromosome[T]) -> bool:
+        """The chromosome is mature once the other maturity checks pass, but still waits for the timeout."""
+        return super().is_mature(chromosome)
+
+    async def wait_for_maturity(self: TimeMaturity[int], chromosome: Chromosome[T]) -> None:
+        """Gives the chromosome time to mature after the other maturity checks pass."""
+        await asyncio.sleep(self.timeout)
+        await super().wait_for_maturity(chromosome)
 
 
 class VarianceMaturity(Maturity[T], Generic[T]):
     """Checks if a chromosome is mature based on its fitness variance."""
     variance: float = 0.1
 
-    async def is_mature(self: VarianceMaturity[int], chromosome: Chromosome[T]) -> bool:
+    def is_mature(self: VarianceMaturity[int], chromosome: Chromosome[T]) -> bool:
         """Checks if a chromosome is mature based on its fitness variance."""
-        return chromosome.fitness < self.variance and await super().is_mature(chromosome)
+        return (
+            hasattr(chromosome.fitness, "variance")
+            and chromosome.fitness.variance < self.variance
+            and super().is_mature(chromosome)
+        )
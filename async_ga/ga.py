@@ -1,30 +1,45 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from async_ga.chromosome import Chromosome, Population
+from async_ga.chromosome import Chromosome, Fitness, Population, fitness_mean
 from async_ga.crosser import Crosser, SinglePointCrosser
 from async_ga.filter import Filter, EliteFilter
+from async_ga.fitness.cache import FitnessCache
 from async_ga.fitness.function import FitnessFunction
 from async_ga.fitness.maturity import Maturity, AgeMaturity, StatisticsMaturity
 from async_ga.mutator import Mutator, NoiseMutator
 from async_ga.selector import Selector, TournamentSelector
 from async_ga.terminator import Terminator, MaxIteration
+from array import array
 import asyncio
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import random
-from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Deque, Iterable, Generic, Literal, List, Optional, Set, Tuple, TypeVar, Union
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Generic, Literal, List, Optional, Set, Tuple, TypeVar, Union
 
 __all__ = ["AsyncGA", "DefaultGA"]
 
 T = TypeVar("T")
 
-async def pairwise(iterable: AsyncIterable[T]) -> AsyncIterator[Tuple[T, T]]:
-    """Groups consecutive pairs of items."""
-    MISSING_ITEM = object()
-    x1 = MISSING_ITEM
-    async for x2 in iterable:
-        if x1 is not MISSING_ITEM:
-            yield x1, x2
-        x1 = x2
+# The state of a running `evolve`, which is not pickled or copied.
+_EVOLVE_ATTRIBUTES = frozenset({
+    "_chromosome_pool", "_evaluating", "_fitness_cache", "_nonsurvivors", "_parents", "_pool", "_tasks",
+})
+
+def _batch_fitness(fitness_sample: Callable[[List[T]], float], data: List[T], n: int, /) -> List[float]:
+    """Computes `n` fitness samples in a worker process."""
+    return [fitness_sample(data) for _ in range(n)]
+
+async def copy_genes(data: Union[AsyncIterable[T], Iterable[T]], /) -> List[T]:
+    """
+    Copies the genes into a new list, since generators may modify and yield the same data repeatedly.
+
+    Chromosomes are copied through their underlying data, since iterating a `UserList` calls `__getitem__` per gene.
+    """
+    if isinstance(data, Chromosome):
+        return list(data.data)
+    elif isinstance(data, AsyncIterable):
+        return [gene async for gene in data]
+    else:
+        return list(data)
 
 
 class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T], Selector[T], Terminator[T], ABC, Generic[T]):
@@ -47,12 +62,44 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
 
     Note:
         The genetic algorithm will attempt to minimize the chromosome fitness.
+        Chromosomes filtered out of the population are reused for new
+        chromosomes, so copy any filtered chromosomes you want to keep.
+        Set `fitness_cache_size` to reuse the fitnesses of identical chromosomes,
+        which is only valid if the fitness does not change over time.
     """
+    _chromosome_pool: List[Chromosome[T]]
+    _evaluating: Dict[Hashable, Awaitable[None]]
+    _fitness_cache: FitnessCache
+    _nonsurvivors: Dict[int, Chromosome[T]]
+    _parents: Tuple[Chromosome[T], ...]
+    _pool: Optional[ProcessPoolExecutor]
     _tasks: Set[Awaitable[Any]]
     chromosome_length: int
+    fitness_batch_size: int = 16
+    fitness_cache_size: int = 0
     fitness_mode: Literal["moving", "square"] = "moving"
+    fitness_yield_every: int = 32
     iteration: int = 0
+    max_workers: Optional[int] = None
+    parallel: bool = False
     population_length: int
+    typecode: Optional[str] = None
+
+    def __getstate__(self: AsyncGA[T], /) -> Dict[str, Any]:
+        """Pickle the attributes, leaving out the state of the running `evolve`, such as its tasks, cache, and process pool."""
+        return {name: value for name, value in vars(self).items() if name not in _EVOLVE_ATTRIBUTES}
+
+    @property
+    def fitness_cache(self: AsyncGA[T], /) -> FitnessCache:
+        """
+        The cache of finished fitnesses from the last `evolve`, including its `hits` and `misses`.
+
+        Caching is opt-in by setting `fitness_cache_size`, since cached
+        fitnesses are no longer updated. Leave it at 0 for noisy or
+        time-varying fitnesses, or for cheap fitnesses where computing
+        the cache keys costs more than the fitness itself.
+        """
+        return self._fitness_cache
 
     async def initial_gene(self: AsyncGA[T], /) -> T:
         """Generate a random gene value."""
@@ -62,7 +109,6 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
         """Default chromosome generator using random genes of the provided chromosome size."""
         for _ in range(self.chromosome_length):
             yield await self.initial_gene()
-            await asyncio.sleep(0)
 
     async def initial_population(self: AsyncGA[T], /) -> AsyncIterable[Union[AsyncIterable[T], Iterable[T]]]:
         """Default population generator using random chromosomes of the provided population size."""
@@ -74,7 +120,30 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
         """Any additional setup required for the population."""
         pass
 
-    async def _update_fitness_task(self: AsyncGA[T], chromosome: Chromosome[T], /) -> None:
+    def fitness_sample(self: AsyncGA[T], data: List[T], /) -> float:
+        """
+        Compute a fitness estimate of the chromosome's data in a worker process.
+
+        Required if `self.parallel` is set, in which case it is used instead
+        of `self.fitness_of`. The genetic algorithm must be picklable, and
+        is sent to the worker processes without the state of the running `evolve`.
+        """
+        raise NotImplementedError("No fitness sample is given.")
+
+    async def _parallel_fitness_of(self: AsyncGA[T], chromosome: Chromosome[T], /) -> AsyncIterator[float]:
+        """Generates estimates of the chromosome's fitness using batches of `self.fitness_sample` in the process pool."""
+        loop = asyncio.get_running_loop()
+        while True:
+            for fitness in await loop.run_in_executor(
+                self._pool, _batch_fitness, self.fitness_sample, chromosome.data[:], self.fitness_batch_size
+            ):
+                yield fitness
+
+    def _fitness_key(self: AsyncGA[T], chromosome: Chromosome[T], /) -> Hashable:
+        """The key used to cache the chromosome's fitness, rounding floats to absorb floating-point near-duplicates."""
+        return tuple(round(gene, 6) if isinstance(gene, float) else gene for gene in chromosome.data)
+
+    async def _update_fitness_task(self: AsyncGA[T], chromosome: Chromosome[T], key: Optional[Hashable], /) -> None:
         """
         Update a chromosome's fitness in the background based on the `fitness_mode`.
 
@@ -88,21 +157,34 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
                 Uses an arithmetic average of the fitness mean and variance.
                 The result is based on every fitness estimate equally.
                 Avoids over-/under-flow, and does not require saving previous iterations.
+
+        Once finished, the fitness is cached under the `key` for up to `fitness_cache_size` chromosomes,
+        unless the `key` is None.
+
+        If `self.parallel` is set, the estimates are computed in batches of
+        `self.fitness_batch_size` using `self.fitness_sample` in a process pool.
+
+        Control is given back to the event loop every `self.fitness_yield_every` estimates.
         """
         try:
+            yield_every = self.fitness_yield_every
+            fitnesses = self.fitness_of(chromosome) if self._pool is None else self._parallel_fitness_of(chromosome)
             if self.fitness_mode == "moving":
                 weight = 0.0
                 mean = 0.0
                 variance = 0.0
-                iterator = self.fitness_of(chromosome).__aiter__()
+                statistics = chromosome.fitness
+                iterator = fitnesses.__aiter__()
                 async for fitness in iterator:
                     weight += 0.01 * (1 - weight)
                     mean += 0.01 * (fitness - mean)
-                    variance += 0.01 * (mean / weight - variance)
+                    unbiased_mean = mean / weight
+                    variance += 0.01 * (unbiased_mean - variance)
                     chromosome.age += 1
-                    chromosome.fitness.mean = mean / weight
-                    chromosome.fitness.variance = variance / weight
-                    await asyncio.sleep(0)
+                    statistics.mean = unbiased_mean
+                    statistics.variance = variance / weight
+                    if chromosome.age % yield_every == 0:
+                        await asyncio.sleep(0)
                     if not chromosome.is_active:
                         if hasattr(iterator, "aclose"):
                             await iterator.aclose()
@@ -111,15 +193,17 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
                 n = 0
                 mean = 0.0
                 mean_squares = 0.0
-                iterator = self.fitness_of(chromosome).__aiter__()
+                statistics = chromosome.fitness
+                iterator = fitnesses.__aiter__()
                 async for fitness in iterator:
                     n += 1
                     mean += (fitness - mean) / n
-                    mean_squares += (fitness ** 2 - mean_squares) / n
+                    mean_squares += (fitness * fitness - mean_squares) / n
                     chromosome.age += 1
-                    chromosome.fitness.mean = mean
-                    chromosome.fitness.variance = mean_squares - mean ** 2
-                    await asyncio.sleep(0)
+                    statistics.mean = mean
+                    statistics.variance = mean_squares - mean * mean
+                    if n % yield_every == 0:
+                        await asyncio.sleep(0)
                     if not chromosome.is_active:
                         if hasattr(iterator, "aclose"):
                             await iterator.aclose()
@@ -128,28 +212,77 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
                 raise ValueError(f"unknown fitness mode {self.fitness_mode!r}")
         finally:
             chromosome.is_active = False
+            # Cache the final fitness, evicting the least recently used fitnesses.
+            if key is not None and hasattr(chromosome.fitness, "mean") and hasattr(chromosome.fitness, "variance"):
+                self._fitness_cache.put(key, chromosome.fitness.mean, chromosome.fitness.variance, chromosome.age)
+            # Identical chromosomes may be evaluated at the same time, so only remove this task's entry.
+            if self._share_fitnesses and self._evaluating.get(key) is asyncio.current_task():
+                del self._evaluating[key]
+            # Release the chromosome if it was filtered out while its fitness was updating.
+            if self._nonsurvivors.pop(id(chromosome), None) is chromosome:
+                self._release_chromosome(chromosome)
+
+    def _release_chromosome(self: AsyncGA[T], chromosome: Chromosome[T], /) -> None:
+        """Return a chromosome which is no longer in use to the pool, so that `create_chromosome` can reuse it."""
+        # Filtered out parents are still being crossed, so they are not reused.
+        if any(chromosome is parent for parent in self._parents):
+            return
+        elif len(self._chromosome_pool) < 2 * self.population_length:
+            chromosome.fitness = Fitness()
+            self._chromosome_pool.append(chromosome)
 
     async def create_chromosome(self: AsyncGA[T], data: Union[AsyncIterable[T], Iterable[T]], /) -> Chromosome[T]:
-        """Create a chromosome using the provided data."""
-        # Setup the chromosome.
-        chromosome = Chromosome()
-        chromosome.data = [gene async for gene in data] if isinstance(data, AsyncIterable) else list(data)
+        """Create a chromosome using a copy of the provided data."""
+        return await self._create_chromosome(await copy_genes(data))
+
+    async def _create_chromosome(self: AsyncGA[T], genes: List[T], /) -> Chromosome[T]:
+        """Create a chromosome which takes ownership of the list of genes."""
+        # Setup the chromosome, reusing a released chromosome if possible.
+        if self._chromosome_pool:
+            chromosome = self._chromosome_pool.pop()
+            chromosome.age = 0
+            chromosome.is_active = True
+        else:
+            chromosome = Chromosome()
+        chromosome.data = genes if self.typecode is None else array(self.typecode, genes)
+        # Skip computing the key entirely if it is not needed.
+        if self._share_fitnesses or self._fitness_cache.maxsize > 0:
+            key = self._fitness_key(chromosome)
+        else:
+            key = None
+        # Fully matured fitnesses may be shared by waiting for an identical chromosome to finish.
+        if self._share_fitnesses and key in self._evaluating:
+            await asyncio.wait([self._evaluating[key]])
+        # Reuse the fitness of an identical chromosome if it was already computed.
+        fitness = None if key is None else self._fitness_cache.get(key)
+        if fitness is not None:
+            chromosome.fitness.mean, chromosome.fitness.variance, chromosome.age = fitness
+            chromosome.is_active = False
+            return chromosome
         # Start evaluating the chromosome's fitness.
-        task = asyncio.create_task(self._update_fitness_task(chromosome))
+        task = asyncio.create_task(self._update_fitness_task(chromosome, key))
+        if self._share_fitnesses:
+            self._evaluating[key] = task
+        # Free up the reference to the fitness updating task once it is done.
         self._tasks.add(task)
-        while True:
-            # Stop once the chromosome is sufficiently mature.
-            if await self.is_mature(chromosome):
-                return chromosome
-            # Stop looping once the fitness is no longer being updated.
-            elif task.done():
-                break
-            # Give time for the chromosome to mature.
-            await asyncio.sleep(0)
+        task.add_done_callback(self._tasks.discard)
+        try:
+            while True:
+                # Stop once the chromosome is sufficiently mature.
+                if self.is_mature(chromosome):
+                    await self.wait_for_maturity(chromosome)
+                    return chromosome
+                # Stop looping once the fitness is no longer being updated.
+                elif task.done():
+                    break
+                # Give time for the chromosome to mature.
+                await asyncio.sleep(0)
+        except BaseException:
+            # Stop updating the fitness if the chromosome is never created, such as if it was cancelled.
+            chromosome.is_active = False
+            raise
         # Check for potential errors while updating the fitness.
-        await task.result()
-        # Free up the reference to the fitness updating task.
-        del self._tasks[task]
+        task.result()
         # If the chromosome is at least usable, return it.
         if hasattr(chromosome.fitness, "mean") and hasattr(chromosome.fitness, "variance"):
             return chromosome
@@ -157,92 +290,123 @@ class AsyncGA(Crosser[T], Filter[T], FitnessFunction[T], Maturity[T], Mutator[T]
         else:
             raise AttributeError("chromosome.fitness.mean and chromosome.fitness.variance were never set")
 
+    async def _create_chromosomes(self: AsyncGA[T], chromosomes: Iterable[List[T]], /) -> List[Chromosome[T]]:
+        """Create chromosomes from the lists of genes concurrently, cancelling the others if any of them fails."""
+        tasks = [asyncio.ensure_future(self._create_chromosome(genes)) for genes in chromosomes]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _generate_parents(self: AsyncGA[T], population: Population[T]) -> AsyncIterable[Chromosome[T]]:
         """Generates parents from the population using `self.select` while `self.is_active()`."""
-        if not await self.is_active():
+        if not self.is_active():
             return
         while True:
             iterator = self.select(population).__aiter__()
             async for parent in iterator:
                 yield parent
-                if not await self.is_active():
+                if not self.is_active():
                     if hasattr(iterator, "aclose"):
                         await iterator.aclose()
                     return
                 await asyncio.sleep(0)
 
-    @staticmethod
-    async def _to_buffer(awaitable: Awaitable[T], buffer: Deque[T]) -> None:
-        buffer.append(await awaitable)
-
     async def _generate_children(self: AsyncGA[T], parent1: Chromosome[T], parent2: Chromosome[T], /) -> AsyncIterable[Chromosome[T]]:
-        """Generates children from the parents using `self.cross` and packages the data into chromosomes."""
-        tasks = []
-        buffer = deque()
-        async for child in self.cross(parent1, parent2):
-            tasks.append(asyncio.create_task(self._to_buffer(self.create_chromosome(child), buffer)))
-            while len(buffer) > 0:
-                yield buffer.popleft()
-                await asyncio.sleep(0)
-            await asyncio.sleep(0)
-        for task in tasks:
-            await task
-            while len(buffer) > 0:
-                yield buffer.popleft()
-                await asyncio.sleep(0)
-            await asyncio.sleep(0)
+        """Generates children from the parents using `self.cross` and packages the data into chromosomes concurrently."""
+        children = [await copy_genes(child) async for child in self.cross(parent1, parent2)]
+        for child in await self._create_chromosomes(children):
+            yield child
 
     async def _generate_mutations(self: AsyncGA[T], child: Chromosome[T], /) -> AsyncIterable[Chromosome[T]]:
-        """Generates mutated children from the child using `self.mutate` and packages the data into chromosomes."""
-        tasks = []
-        buffer = deque()
-        async for mutation in self.mutate(child):
-            tasks.append(asyncio.create_task(self._to_buffer(self.create_chromosome(mutation), buffer)))
-            while len(buffer) > 0:
-                yield buffer.popleft()
-                await asyncio.sleep(0)
-            await asyncio.sleep(0)
-        for task in tasks:
-            await task
-            while len(buffer) > 0:
-                yield buffer.popleft()
-                await asyncio.sleep(0)
-            await asyncio.sleep(0)
+        """Generates mutated children from the child using `self.mutate` and packages the data into chromosomes concurrently."""
+        mutations = [await copy_genes(mutation) async for mutation in self.mutate(child)]
+        for mutation in await self._create_chromosomes(mutations):
+            yield mutation
 
     async def evolve(self: AsyncGA[T], /, population: Optional[Population[T]] = None) -> AsyncIterator[Population[T]]:
+        if self.fitness_yield_every < 1:
+            raise ValueError(f"fitness_yield_every must be at least 1, got {self.fitness_yield_every!r}")
+        self._chromosome_pool = []
+        self._evaluating = {}
+        self._fitness_cache = FitnessCache(self.fitness_cache_size)
+        self._nonsurvivors = {}
+        self._parents = ()
+        self._pool = None
         self._tasks = set()
-        # Get the starting population.
-        if population is None:
-            population = [
-                await self.create_chromosome(chromosome)
-                async for chromosome in self.initial_population()
-            ]
-        else:
-            # Restart fitness estimates for the population.
-            for i, chromosome in enumerate(population):
-                population[i] = await self.create_chromosome(chromosome)
         try:
-            population.sort(key=lambda chromosome: chromosome.fitness.mean)
+            if self.parallel:
+                self._pool = ProcessPoolExecutor(self.max_workers)
+            # Get the starting population, evaluating the chromosomes concurrently.
+            if population is None:
+                chromosomes = [await copy_genes(chromosome) async for chromosome in self.initial_population()]
+                population = await self._create_chromosomes(chromosomes)
+            else:
+                # Restart fitness estimates for the population.
+                population[:] = await self._create_chromosomes([await copy_genes(chromosome) for chromosome in population])
+            population.sort(key=fitness_mean)
             await self.setup(population)
             yield population
-            async for parent1, parent2 in pairwise(self._generate_parents(population)):
+            # Bind the methods used every generation as locals.
+            generate_children = self._generate_children
+            generate_mutations = self._generate_mutations
+            filter_nonsurvivors = self.filter_nonsurvivors
+            nonsurvivors = self._nonsurvivors
+            release_chromosome = self._release_chromosome
+            sort = population.sort
+            # Pair each parent with the previous parent directly, avoiding an extra async generator per pair.
+            parent1 = None
+            async for parent2 in self._generate_parents(population):
+                if parent1 is None:
+                    parent1 = parent2
+                    continue
                 self.iteration += 1
+                self._parents = (parent1, parent2)
                 # Add to the population.
-                async for child in self._generate_children(parent1, parent2):
+                async for child in generate_children(parent1, parent2):
                     child.is_active = False
-                    async for mutation in self._generate_mutations(child):
+                    async for mutation in generate_mutations(child):
+                        # Re-sort before filtering, since the fitnesses keep updating in the background.
+                        # The population is nearly sorted, so this takes about linear time.
                         population.append(mutation)
-                        population.sort(key=lambda chromosome: chromosome.fitness.mean)
+                        sort(key=fitness_mean)
                         # Kill those that couldn't survive and stop computing their fitnesses.
-                        async for chromosome in self.filter_nonsurvivors(population):
-                            chromosome.is_active = False
+                        async for chromosome in filter_nonsurvivors(population):
+                            # Release the chromosome once its fitness stops updating.
+                            if chromosome.is_active:
+                                chromosome.is_active = False
+                                nonsurvivors[id(chromosome)] = chromosome
+                            else:
+                                release_chromosome(chromosome)
+                sort(key=fitness_mean)
                 yield population
-        finally:
-            # Finish computing the fitnesses.
-            for chromosome in population:
-                chromosome.is_active = False
-            await asyncio.gather(*self._tasks)
+                parent1 = parent2
+        except GeneratorExit:
+            # Closing the generator early finishes computing the fitnesses normally.
+            raise
+        except BaseException:
+            # Stop computing the fitnesses if evolving failed or was cancelled.
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
             self._tasks.clear()
+            raise
+        finally:
+            try:
+                # Finish computing the fitnesses.
+                for chromosome in population or ():
+                    chromosome.is_active = False
+                await asyncio.gather(*self._tasks)
+            finally:
+                self._tasks.clear()
+                self._nonsurvivors.clear()
+                # Stop any background work left over by the fitness function.
+                await self._close_fitness()
+                if self._pool is not None:
+                    self._pool.shutdown()
 
     async def main(self: AsyncGA[T], /, population: Optional[Population[T]] = None) -> Population[T]:
         """Returns the last population from `self.evolve()`."""
@@ -336,9 +500,10 @@ class DefaultGA(
 
     async def fitness_of(self: DefaultGA, chromosome: Chromosome[int]) -> AsyncIterator[float]:
         """Generates 0 if a gene is 5 and 1 if a gene is not 5."""
+        # Only test the genes of a random percent of the chromosome each iteration.
+        k = round(self.percent * self.chromosome_length)
+        # Sample the underlying list directly to avoid `UserList.__getitem__` calls per gene.
+        data = chromosome.data
+        choices = random.choices
         while True:
-            # Only test the genes of a random percent of the chromosome each iteration.
-            yield sum(
-                (gene - 5) ** 2
-                for gene in random.choices(chromosome, k=round(self.percent * self.chromosome_length))
-            ) / round(self.percent * self.chromosome_length)
+            yield sum([(gene - 5.0) * (gene - 5.0) for gene in choices(data, k=k)]) / k
@@ -30,11 +30,18 @@ class GeneMutator(Mutator[T], Generic[T]):
 
     async def mutate(self: Mutator[T], chromosome: Chromosome[T]) -> AsyncIterator[Chromosome[T]]:
         """Replaces random genes with new random genes."""
+        data = chromosome.data
+        n = len(data)
+        if n == 0:
+            raise ValueError("at least 1 gene is required to mutate genes")
+        random_ = random.random
         for _ in range(self.repeat):
-            chromosome[random.randrange(len(chromosome))] = await self.initial_gene()
+            data[int(random_() * n)] = await self.initial_gene()
             yield chromosome
-        async for mutation in super().mutate(chromosome):
-            yield mutation
+        # Skip the base mutator, which has no mutations.
+        if super().mutate.__func__ is not Mutator.mutate:
+            async for mutation in super().mutate(chromosome):
+                yield mutation
 
 
 class NoiseMutator(Mutator[float]):
@@ -45,11 +52,20 @@ class NoiseMutator(Mutator[float]):
 
     async def mutate(self: NoiseMutator, chromosome: Chromosome[float]) -> AsyncIterator[Chromosome[float]]:
         """Add gaussian noise to random genes. The noise decays by a factor of 1 / sqrt(iteration)."""
+        data = chromosome.data
+        n = len(data)
+        if n == 0:
+            raise ValueError("at least 1 gene is required to mutate genes")
+        deviation = self.deviation / sqrt(self.iteration)
+        gauss = random.gauss
+        random_ = random.random
         for _ in range(self.repeat):
-            chromosome[random.randrange(len(chromosome))] += random.gauss(0, self.deviation) / sqrt(self.iteration)
+            data[int(random_() * n)] += gauss(0, deviation)
             yield chromosome
-        async for mutation in super().mutate(chromosome):
-            yield mutation
+        # Skip the base mutator, which has no mutations.
+        if super().mutate.__func__ is not Mutator.mutate:
+            async for mutation in super().mutate(chromosome):
+                yield mutation
 
 
 class IntMutator(Mutator[int]):
@@ -58,11 +74,20 @@ class IntMutator(Mutator[int]):
 
     async def mutate(self: IntMutator, chromosome: Chromosome[int]) -> AsyncIterator[Chromosome[int]]:
         """Increment or decrement random genes."""
+        data = chromosome.data
+        n = len(data)
+        if n == 0:
+            raise ValueError("at least 1 gene is required to mutate genes")
+        getrandbits = random.getrandbits
+        random_ = random.random
         for _ in range(self.repeat):
-            chromosome[random.randrange(len(chromosome))] += random.choice([-1, 1])
+            # Map a random bit to -1 or 1.
+            data[int(random_() * n)] += (getrandbits(1) << 1) - 1
             yield chromosome
-        async for mutation in super().mutate(chromosome):
-            yield mutation
+        # Skip the base mutator, which has no mutations.
+        if super().mutate.__func__ is not Mutator.mutate:
+            async for mutation in super().mutate(chromosome):
+                yield mutation
 
 
 class SwapMutator(Mutator[int]):
@@ -71,9 +96,19 @@ class SwapMutator(Mutator[int]):
 
     async def mutate(self: IntMutator, chromosome: Chromosome[int]) -> AsyncIterator[Chromosome[int]]:
         """Randomly swap genes."""
+        data = chromosome.data
+        n = len(data)
+        if n < 2:
+            raise ValueError("at least 2 genes are required to swap genes")
+        random_ = random.random
         for _ in range(self.repeat):
-            i1, i2 = random.sample(range(len(chromosome)), k=2)
-            chromosome[i1], chromosome[i2] = chromosome[i2], chromosome[i1]
+            # Draw 2 distinct indexes by skipping over the first index.
+            i1 = int(random_() * n)
+            i2 = int(random_() * (n - 1))
+            i2 += i2 >= i1
+            data[i1], data[i2] = data[i2], data[i1]
             yield chromosome
-        async for mutation in super().mutate(chromosome):
-            yield mutation
+        # Skip the base mutator, which has no mutations.
+        if super().mutate.__func__ is not Mutator.mutate:
+            async for mutation in super().mutate(chromosome):
+                yield mutation
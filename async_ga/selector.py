@@ -1,8 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from async_ga.chromosome import Chromosome, Population
+from async_ga.chromosome import Chromosome, Population, fitness_mean
+from bisect import bisect
+from inspect import iscoroutinefunction
+from itertools import accumulate
 import random
-from typing import AsyncIterable, AsyncIterator, Generic, List, TypeVar
+from typing import Any, AsyncIterable, AsyncIterator, Generic, List, TypeVar
 
 __all__ = ["Selector", "RandomSelector", "TournamentSelector", "RouletteSelector"]
 
@@ -21,8 +24,12 @@ class Selector(ABC, Generic[T]):
 
 class RandomSelector(Selector[T], ABC, Generic[T]):
     """Select a parent randomly from the population each iteration based on some weights."""
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if iscoroutinefunction(cls.selector_key):
+            raise TypeError(f"{cls.__name__}.selector_key must be synchronous, not async")
 
-    async def selector_key(self: RandomSelector[T], weight: float) -> float:
+    def selector_key(self: RandomSelector[T], weight: float) -> float:
         """A modifiable key function that allows different probabilities that a chromosome is chosen."""
         return weight
 
@@ -30,19 +37,34 @@ class RandomSelector(Selector[T], ABC, Generic[T]):
     async def get_weights(self: RandomSelector[T], population: Population[T]) -> AsyncIterable[float]:
         """Generate the weights from the population. Low weights -> high probability of becoming a parent."""
 
+    async def _raw_weights(self: RandomSelector[T], population: Population[T]) -> List[float]:
+        """Collect the weights from `self.get_weights`, which subclasses may read directly instead."""
+        return [weight async for weight in self.get_weights(population)]
+
+    def _select_index(self: RandomSelector[T], weights: List[float], max_weight: float) -> int:
+        """Stochastic acceptance: draw uniformly and accept proportionally to the weight."""
+        n = len(weights)
+        random_ = random.random
+        while True:
+            i = int(random_() * n)
+            if random_() * max_weight <= weights[i]:
+                return i
+
     async def select(self: RandomSelector[T], population: Population[T]) -> AsyncIterator[Chromosome[T]]:
         """
         Indefinitely select random parents from the population each iteration based on the weights.
 
-        Sorts the population every iteration.
+        Sorts the population every iteration, and then draws a parent in O(1)
+        expected time using stochastic acceptance against the largest weight.
         """
-        population.sort(key=lambda chromosome: chromosome.fitness.mean)
-        weights = [weight async for weight in self.get_weights(population)]
-        weights.reverse()
-        min_weight = min(weights)
-        for i, weight in enumerate(weights):
-            weights[i] = await self.selector_key(weight - min_weight)
-        yield population[random.choices(range(len(population)), weights)[0]]
+        population.sort(key=fitness_mean)
+        raw_weights = await self._raw_weights(population)
+        # Reverse, shift, and transform the weights in a single pass.
+        min_weight = min(raw_weights)
+        selector_key = self.selector_key
+        weights = [selector_key(weight - min_weight) for weight in reversed(raw_weights)]
+        max_weight = max(weights)
+        yield population[self._select_index(weights, max_weight)]
         async for parent in super().select(population):
             yield parent
 
@@ -50,7 +72,33 @@ class RandomSelector(Selector[T], ABC, Generic[T]):
 class TournamentSelector(RandomSelector[T], Generic[T]):
     """Tournament selection randomly selects chromosomes based on their population ranking."""
 
-    async def selector_key(self: TournamentSelector[T], weight: float) -> float:
+    async def select(self: TournamentSelector[T], population: Population[T]) -> AsyncIterator[Chromosome[T]]:
+        """
+        Select a parent with probability proportional to its squared rank, counting from the worst chromosome.
+
+        Draws the rank in O(1) expected time directly from its distribution, without using the weights,
+        unless `selector_key` or `get_weights` is overridden.
+        """
+        cls = type(self)
+        if cls.selector_key is not TournamentSelector.selector_key or cls.get_weights is not TournamentSelector.get_weights:
+            async for parent in super().select(population):
+                yield parent
+            return
+        population.sort(key=fitness_mean)
+        n = len(population)
+        random_ = random.random
+        rank = 0
+        while n > 1:
+            # The cube root draws ranks with probability (3r^2 + 3r + 1) / n^3, which rejection corrects to r^2.
+            # Rounding may give a cube root of 1.0, so clamp the rank.
+            rank = min(int(n * random_() ** (1 / 3)), n - 1)
+            if random_() * (3 * rank * (rank + 1) + 1) < 3 * rank * rank:
+                break
+        yield population[n - 1 - rank]
+        async for parent in super(RandomSelector, self).select(population):
+            yield parent
+
+    def selector_key(self: TournamentSelector[T], weight: float) -> float:
         """By default, the tournament selector squares the weights."""
         return weight * weight
 
@@ -63,7 +111,23 @@ class TournamentSelector(RandomSelector[T], Generic[T]):
 class RouletteSelector(RandomSelector[T], Generic[T]):
     """Roulette selection randomly selects chromosomes based on their fitness."""
 
+    def _select_index(self: RouletteSelector[T], weights: List[float], max_weight: float) -> int:
+        """
+        Bisect the cumulative weights, since skewed fitnesses may
+        cause stochastic acceptance to reject most draws.
+        """
+        cum_weights = list(accumulate(weights))
+        if cum_weights[-1] <= 0:
+            return super()._select_index(weights, max_weight)
+        return bisect(cum_weights, random.random() * cum_weights[-1])
+
+    async def _raw_weights(self: RouletteSelector[T], population: Population[T]) -> List[float]:
+        """Read the fitness means directly, unless `get_weights` is overridden."""
+        if type(self).get_weights is RouletteSelector.get_weights:
+            return list(map(fitness_mean, population))
+        return await super()._raw_weights(population)
+
     async def get_weights(self: RouletteSelector[T], population: Population[T]) -> AsyncIterator[float]:
         """Generate the weights from the population using the fitness means."""
-        for chromosome in population:
-            yield chromosome.fitness.mean
+        for mean in map(fitness_mean, population):
+            yield mean
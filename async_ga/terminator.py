@@ -1,7 +1,7 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from time import time
-from typing import Any, Generic, TypeVar
+from inspect import iscoroutinefunction
+from time import perf_counter, time
+from typing import Any, Callable, Generic, Tuple, TypeVar
 
 __all__ = ["Terminator", "MaxIteration", "TimeLimit"]
 
@@ -9,11 +9,35 @@ T = TypeVar("T")
 
 
 class Terminator(Generic[T]):
-    """Abstract base class for terminating a genetic algorithm."""
+    """
+    Base class for terminating a genetic algorithm.
 
-    @abstractmethod
-    async def is_active(self: Terminator) -> bool:
+    Subclasses define a `should_continue` condition instead of overriding
+    `is_active`, which checks the conditions of every terminator in the MRO
+    in a single loop. Overriding a terminator's `should_continue` replaces
+    its condition, so call `super().should_continue()` to extend it instead.
+    """
+    _conditions: Tuple[Callable[[Terminator], bool], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Async overrides would return a coroutine, which is always truthy.
+        for name in ("is_active", "should_continue"):
+            if iscoroutinefunction(getattr(cls, name, None)):
+                raise TypeError(f"{cls.__name__}.{name} must be synchronous, not async")
+        # Collect the conditions in MRO order, skipping conditions overridden by a subclass.
+        bases = [base for base in cls.__mro__ if "should_continue" in vars(base)]
+        cls._conditions = tuple(
+            vars(base)["should_continue"]
+            for i, base in enumerate(bases)
+            if not any(issubclass(subclass, base) for subclass in bases[:i])
+        )
+
+    def is_active(self: Terminator) -> bool:
         """Returns whether the genetic algorithm is still actively running."""
+        for condition in self._conditions:
+            if not condition(self):
+                return False
         return True
 
 
@@ -22,20 +46,30 @@ class MaxIteration(Terminator[T], Generic[T]):
     iteration: int = 0
     max_iteration: int = 100
 
-    async def is_active(self: MaxIteration[T]) -> bool:
+    def should_continue(self: MaxIteration[T]) -> bool:
         """Terminates after a maximum number of iterations."""
-        return self.iteration < self.max_iteration and await super().is_active()
+        return self.iteration < self.max_iteration
 
 
 class TimeLimit(Terminator[T], Generic[T]):
-    """Terminates after a maximum time limit."""
-    end_time: float
+    """Terminates after a maximum time limit, measured in seconds from when the genetic algorithm is created."""
+    _deadline: float
     max_time: float = 60
 
     def __init__(self: TimeLimit[T], *args: Any, **kwargs: Any) -> None:
-        self.end_time = time() + self.max_time
+        # Check against a monotonic `perf_counter` deadline, so clock adjustments don't affect the time limit.
+        self._deadline = perf_counter() + self.max_time
         super().__init__(*args, **kwargs)
 
-    async def is_active(self: Terminator) -> bool:
-        """Terminates after a maximum number of iterations."""
-        return time() < self.end_time and await super().is_active()
+    @property
+    def end_time(self: TimeLimit[T]) -> float:
+        """The `time()` at which the genetic algorithm terminates. Assign to it to extend or shorten the time limit."""
+        return time() + (self._deadline - perf_counter())
+
+    @end_time.setter
+    def end_time(self: TimeLimit[T], end_time: float) -> None:
+        self._deadline = perf_counter() + (end_time - time())
+
+    def should_continue(self: TimeLimit[T]) -> bool:
+        """Terminates after a maximum time limit."""
+        return perf_counter() < self._deadline